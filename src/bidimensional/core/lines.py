@@ -29,8 +29,16 @@ class Line:
         a (Coordinate): the first coordinate.
         b (Coordinate): the second coordinate.
         slope (float): the slope of the line.
+        intercept (float): the y-intercept of the line.
     """
 
+    __slots__ = ("_a", "_b", "_slope", "_intercept")
+
+    _a: Coordinate
+    _b: Coordinate
+    _slope: float
+    _intercept: float
+
     STYLES = {
         "color": "#7d4e11",
         "lw": 1.25,
@@ -50,8 +58,6 @@ class Line:
             a (Coordinate): the first coordinate.
             b (Coordinate): the second coordinate.
         """
-        self._properties = {}
-
         self.a = a
         self.b = b
 
@@ -78,7 +84,7 @@ class Line:
             raise TypeError(self._ERROR_MSGS.get("TypeError1"))
 
         self._a = value
-        self._properties.clear()
+        self._invalidate()
 
     @property
     def b(self) -> Coordinate:
@@ -103,7 +109,7 @@ class Line:
             raise TypeError(self._ERROR_MSGS.get("TypeError1"))
 
         self._b = value
-        self._properties.clear()
+        self._invalidate()
 
     @property
     def slope(self) -> float:
@@ -112,23 +118,43 @@ class Line:
         Returns:
             float: the slope of the line.
         """
-        if self._properties.get("slope") is None:
+        return self._slope
+
+    @property
+    def intercept(self) -> float:
+        """Get the y-intercept of the line.
+
+        Returns:
+            float: the y-intercept of the line.
+        """
+        return self._intercept
+
+    def _invalidate(self) -> None:
+        """Update the properties derived from the coordinates of the line.
+
+        Note:
+            This method is called whenever a coordinate of the line is set.
+            Subclasses must extend it to reset their own cached properties.
+        """
+        if hasattr(self, "_b"):
+            self._compute_coefficients()
 
-            if self.b.x - self.a.x == 0:
-                print("Warning: slope has an infinite value.")
+    def _compute_coefficients(self) -> None:
+        """Compute the slope and the y-intercept of the line.
 
-                self._properties["slope"] = (
-                    (self.b.y - self.a.y)
-                    / 1e-14
-                )
+        Note:
+            Vertical lines are approximated with a horizontal displacement of
+            1e-14 units, since their slope has an infinite value. A warning is
+            printed whenever such a line is defined.
+        """
+        x_displacement = self._b.x - self._a.x
 
-            else:
-                self._properties["slope"] = (
-                    (self.b.y - self.a.y)
-                    / (self.b.x - self.a.x)
-                )
+        if not x_displacement:
+            print("Warning: slope has an infinite value.")
+            x_displacement = 1e-14
 
-        return self._properties["slope"]
+        self._slope = (self._b.y - self._a.y) / x_displacement
+        self._intercept = self._a.y - self._slope * self._a.x
 
     def intersect(self, line: Line) -> Optional[Coordinate]:
         """Determine the intersection between two lines.
@@ -150,14 +176,13 @@ class Line:
         if not isinstance(line, Line):
             raise TypeError(f"Expected Line, got {type(line)}")
 
-        if self.slope == line.slope:
+        slope_diff = self._slope - line._slope
+
+        if not slope_diff:
             return None
 
-        x = (
-            line.b.y - self.b.y + self.slope
-            * self.b.x - line.slope * line.b.x
-        ) / (self.slope - line.slope)
-        y = self.slope * (x - self.b.x) + self.b.y
+        x = (line._intercept - self._intercept) / slope_diff
+        y = self._slope * x + self._intercept
 
         return Coordinate(x, y)
 
@@ -309,6 +334,10 @@ class Segment(Line):
         slope (float): the slope of the segment.
     """
 
+    __slots__ = ("_distance",)
+
+    _distance: Optional[float]
+
     STYLES = {
         "color": "#396fe3",
         "lw": 1.5,
@@ -349,10 +378,20 @@ class Segment(Line):
         Returns:
             float: The y difference between the two coordinates.
         """
-        if self._properties.get("distance") is None:
-            self._properties["distance"] = op.distance(self._a, self._b)
+        if self._distance is None:
+            self._distance = op.distance(self._a, self._b)
+
+        return self._distance
 
-        return self._properties["distance"]
+    def _invalidate(self) -> None:
+        """Update the properties derived from the coordinates of the segment.
+
+        Note:
+            The cached distance of the segment is reset, since it depends on
+            the coordinates of the segment.
+        """
+        super()._invalidate()
+        self._distance = None
 
     def intersect(self, line: Line) -> Optional[Coordinate]:
         """Determine the intersection between two segments.
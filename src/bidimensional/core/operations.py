@@ -30,7 +30,7 @@ def distance(a: Coordinate, b: Coordinate) -> float:
     if not all(isinstance(x, Coordinate) for x in (a, b)):
         raise TypeError("a and b must be Coordinate instances")
 
-    return math.sqrt((a.x - b.x) ** 2 + (a.y - b.y) ** 2)
+    return math.hypot(a.x - b.x, a.y - b.y)
 
 
 def angle(a: Coordinate, b: Coordinate, c: Coordinate) -> float:
@@ -8,16 +8,55 @@ Authors:
     Paulo Sanchez (@erlete) (author of the modified code)
 """
 
-import math
+from __future__ import annotations
+
 from bisect import bisect
 from typing import Iterable, Optional, Sequence, Tuple, Union
 
 import matplotlib.pyplot as plt
 import numpy as np
+from scipy.linalg import solve_banded
 
 from ..core.coordinate import Coordinate
 
 
+def _evaluate_splines(
+    spline_x: _UnidimensionalSpline,
+    spline_y: _UnidimensionalSpline,
+    samples: np.ndarray,
+    indices: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Evaluate a pair of splines sharing the same knots (internal).
+
+    Args:
+        spline_x (_UnidimensionalSpline): x-axis spline.
+        spline_y (_UnidimensionalSpline): y-axis spline.
+        samples (np.ndarray): parameter values to evaluate.
+        indices (np.ndarray): indices of the spline sections that contain
+            each sample.
+
+    Returns:
+        Tuple[np.ndarray, ...]: x-coordinates, y-coordinates, curvature and
+            yaw of the samples.
+
+    Notes:
+        The spline section indices are shared by both splines and all their
+        derivatives, so they only need to be searched once.
+    """
+    x = spline_x.position_vec(samples, indices)
+    y = spline_y.position_vec(samples, indices)
+
+    x1 = spline_x.first_derivative_vec(samples, indices)
+    y1 = spline_y.first_derivative_vec(samples, indices)
+    x2 = spline_x.second_derivative_vec(samples, indices)
+    y2 = spline_y.second_derivative_vec(samples, indices)
+
+    curvature = (y2 * x1 - x2 * y1) / (x1 * x1 + y1 * y1)**1.5
+    yaw = np.arctan2(y1, x1)
+
+    return x, y, curvature, yaw
+
+
 class _UnidimensionalSpline:
     """Unidimensional spline computation class (internal).
 
@@ -25,18 +64,30 @@ class _UnidimensionalSpline:
     a cubic spline.
     """
 
-    def __init__(self, x: Sequence[Union[int, float]], y: Sequence[Union[int, float]]):
+    def __init__(self, x: Union[Sequence[Union[int, float]], np.ndarray],
+                 y: Union[Sequence[Union[int, float]], np.ndarray],
+                 b: Optional[np.ndarray] = None,
+                 x_diff: Optional[np.ndarray] = None):
         """Initialize a unidimensional spline instance.
 
         Args:
-            x (Sequence[Union[int, float]]): sequence of x-coordinates.
-            y (Sequence[Union[int, float]]): sequence of y-coordinates.
+            x (Union[Sequence[Union[int, float]], np.ndarray]): sequence of
+                x-coordinates.
+            y (Union[Sequence[Union[int, float]], np.ndarray]): sequence of
+                y-coordinates.
+            b (Optional[np.ndarray], optional): precomputed values of the b
+                coefficient (see `_UnidimensionalSpline.from_shared`).
+                Defaults to None (if None, they are computed).
+            x_diff (Optional[np.ndarray], optional): precomputed differences
+                between the x-coordinates (see
+                `_UnidimensionalSpline.from_shared`). Defaults to None (if
+                None, they are computed).
 
         Raises:
             ValueError: if the x and y sequences have different lengths.
         """
-        self.x = np.array(x)
-        self.y = np.array(y)
+        self.x = np.asarray(x, dtype=np.float64)
+        self.y = np.asarray(y, dtype=np.float64)
 
         if self.x.shape != self.y.shape:
             raise ValueError("x and y must have the same shape")
@@ -45,36 +96,125 @@ class _UnidimensionalSpline:
         self._x_dim = self.x.shape[0]
 
         # Compute the differences between the x-coordinates:
-        self._x_diff = np.diff(x)
-
-        # Compute coefficient d:
-        self.d = np.array(y)
+        self._x_diff = np.diff(self.x) if x_diff is None else x_diff
 
         # Compute the difference between d coefficients:
-        d_diff = np.diff(self.d)
+        d_diff = np.diff(self.y)
 
         # Compute coefficient b:
-        self.b = np.linalg.solve(
-            self.__calc_matrix_a(),
-            self.__calc_matrix_b()
-        )
+        if b is None:
+            b = solve_banded(
+                (1, 1),
+                self.__calc_matrix_a(self._x_diff),
+                self.__calc_matrix_b(self._x_diff, self.y)
+            )
 
         # Compute the difference between b coefficients:
-        b_diff = np.diff(self.b)
+        b_diff = np.diff(b)
+
+        # Store the a, b, c and d coefficients, one row per spline section:
+        self._coefs = np.empty((self._x_dim - 1, 4))
+
+        # Compute coefficient a:
+        self._coefs[:, 0] = b_diff / (3.0 * self._x_diff)
+
+        # Compute coefficient b:
+        self._coefs[:, 1] = b[:-1]
 
         # Compute coefficient c:
-        self.c = (
+        self._coefs[:, 2] = (
             d_diff / self._x_diff
-            - self._x_diff * (self.b[1:] + 2.0 * self.b[:-1]) / 3.0
+            - self._x_diff * (b[1:] + 2.0 * b[:-1]) / 3.0
         )
 
-        # Compute coefficient a:
-        self.a = b_diff / (3.0 * self._x_diff)
+        # Compute coefficient d:
+        self._coefs[:, 3] = self.y[:-1]
 
-        self.b = self.b[:-1]
-        self.d = self.d[:-1]
+        # Prevent external modifications of the coefficients:
+        self._coefs.setflags(write=False)
 
-        self.pos = None
+    @classmethod
+    def from_shared(cls, x: Sequence[Union[int, float]],
+                    *ys: Sequence[Union[int, float]]
+                    ) -> Tuple[_UnidimensionalSpline, ...]:
+        """Initialize several unidimensional splines sharing x-coordinates.
+
+        Args:
+            x (Sequence[Union[int, float]]): sequence of x-coordinates shared
+                by all splines.
+            *ys (Sequence[Union[int, float]]): sequences of y-coordinates, one
+                per spline.
+
+        Returns:
+            Tuple[_UnidimensionalSpline, ...]: one spline per sequence of
+                y-coordinates.
+
+        Notes:
+            The A matrix only depends on the x-coordinates, so it is built
+            once and all b coefficients are solved in a single call.
+        """
+        x_arr = np.asarray(x, dtype=np.float64)
+        y_arrs = tuple(np.asarray(y, dtype=np.float64) for y in ys)
+        x_diff = np.diff(x_arr)
+
+        b = solve_banded(
+            (1, 1),
+            cls.__calc_matrix_a(x_diff),
+            np.column_stack([cls.__calc_matrix_b(x_diff, y) for y in y_arrs])
+        )
+
+        return tuple(
+            cls(x_arr, y, b[:, i], x_diff) for i, y in enumerate(y_arrs)
+        )
+
+    @property
+    def coefs(self) -> np.ndarray:
+        """Get the coefficients of the spline sections.
+
+        Returns:
+            np.ndarray: a, b, c and d coefficients of every spline section,
+                one row per section.
+
+        Note:
+            The returned array is read-only.
+        """
+        return self._coefs
+
+    @property
+    def a(self) -> np.ndarray:
+        """Get the a coefficients of the spline sections.
+
+        Returns:
+            np.ndarray: a coefficients of the spline sections.
+        """
+        return self._coefs[:, 0]
+
+    @property
+    def b(self) -> np.ndarray:
+        """Get the b coefficients of the spline sections.
+
+        Returns:
+            np.ndarray: b coefficients of the spline sections.
+        """
+        return self._coefs[:, 1]
+
+    @property
+    def c(self) -> np.ndarray:
+        """Get the c coefficients of the spline sections.
+
+        Returns:
+            np.ndarray: c coefficients of the spline sections.
+        """
+        return self._coefs[:, 2]
+
+    @property
+    def d(self) -> np.ndarray:
+        """Get the d coefficients of the spline sections.
+
+        Returns:
+            np.ndarray: d coefficients of the spline sections.
+        """
+        return self._coefs[:, 3]
 
     def position(self, x: Union[int, float]) -> Optional[Union[int, float]]:
         """Compute the image of a given x-value in a spline section.
@@ -95,20 +235,9 @@ class _UnidimensionalSpline:
         i = self.__search_index(x)
         dx = x - self.x[i]
 
-        if self.pos is None:
-            self.pos = (
-                self.a * dx**3.0
-                + self.b * dx**2.0
-                + self.c * dx
-                + self.d
-            )
+        co = self._coefs[i]
 
-        return (
-            self.a[i] * dx**3.0
-            + self.b[i] * dx**2.0
-            + self.c[i] * dx
-            + self.d[i]
-        )
+        return ((co[0] * dx + co[1]) * dx + co[2]) * dx + co[3]
 
     def first_derivative(self, x: Union[int, float]) -> Optional[Union[int, float]]:
         """Compute the first derivative of an x-value.
@@ -128,12 +257,9 @@ class _UnidimensionalSpline:
 
         i = self.__search_index(x)
         dx = x - self.x[i]
+        co = self._coefs[i]
 
-        return (
-            3.0 * self.a[i] * dx**2.0
-            + 2.0 * self.b[i] * dx
-            + self.c[i]
-        )
+        return (3.0 * co[0] * dx + 2.0 * co[1]) * dx + co[2]
 
     def second_derivative(self, x: Union[int, float]) -> Optional[Union[int, float]]:
         """Compute the second derivative of an x-value.
@@ -153,54 +279,133 @@ class _UnidimensionalSpline:
 
         i = self.__search_index(x)
         dx = x - self.x[i]
+        co = self._coefs[i]
 
-        return (
-            6.0 * self.a[i] * dx
-            + 2.0 * self.b[i]
-        )
+        return 6.0 * co[0] * dx + 2.0 * co[1]
+
+    def position_vec(self, x: np.ndarray,
+                     indices: Optional[np.ndarray] = None) -> np.ndarray:
+        """Compute the images of a given set of x-values.
+
+        Args:
+            x (np.ndarray): the x-values to compute the images of.
+            indices (Optional[np.ndarray], optional): precomputed indices of
+                the spline sections that contain the x-values (see
+                `_UnidimensionalSpline._indices_for`). Defaults to None (if
+                None, they are searched).
+
+        Returns:
+            np.ndarray: the images of the x-values.
 
-    def __calc_matrix_a(self) -> np.array:
+        Notes:
+            The form of the function is: f(x) = a*x^3 + b*x^2 + c*x + d.
+            X-values outside of the X-range are extrapolated from the
+            closest spline section.
+        """
+        i = self._indices_for(x) if indices is None else indices
+        dx = x - self.x[i]
+        a, b, c, d = self._coefs[i].T
+
+        return ((a * dx + b) * dx + c) * dx + d
+
+    def first_derivative_vec(self, x: np.ndarray,
+                             indices: Optional[np.ndarray] = None
+                             ) -> np.ndarray:
+        """Compute the first derivatives of a given set of x-values.
+
+        Args:
+            x (np.ndarray): the x-values to compute the first derivative of.
+            indices (Optional[np.ndarray], optional): precomputed indices of
+                the spline sections that contain the x-values (see
+                `_UnidimensionalSpline._indices_for`). Defaults to None (if
+                None, they are searched).
+
+        Returns:
+            np.ndarray: the first derivatives of the x-values.
+
+        Notes:
+            The form of the function is: f'(x) = 3*a*x^2 + 2*b*x + c.
+            X-values outside of the X-range are extrapolated from the
+            closest spline section.
+        """
+        i = self._indices_for(x) if indices is None else indices
+        dx = x - self.x[i]
+        a, b, c, _ = self._coefs[i].T
+
+        return (3.0 * a * dx + 2.0 * b) * dx + c
+
+    def second_derivative_vec(self, x: np.ndarray,
+                              indices: Optional[np.ndarray] = None
+                              ) -> np.ndarray:
+        """Compute the second derivatives of a given set of x-values.
+
+        Args:
+            x (np.ndarray): the x-values to compute the second derivative of.
+            indices (Optional[np.ndarray], optional): precomputed indices of
+                the spline sections that contain the x-values (see
+                `_UnidimensionalSpline._indices_for`). Defaults to None (if
+                None, they are searched).
+
+        Returns:
+            np.ndarray: the second derivatives of the x-values.
+
+        Notes:
+            The form of the function is: f''(x) = 6*a*x + 2*b.
+            X-values outside of the X-range are extrapolated from the
+            closest spline section.
+        """
+        i = self._indices_for(x) if indices is None else indices
+        dx = x - self.x[i]
+        a, b, _, _ = self._coefs[i].T
+
+        return 6.0 * a * dx + 2.0 * b
+
+    @staticmethod
+    def __calc_matrix_a(x_diff: np.ndarray) -> np.ndarray:
         """Compute the A matrix for the spline coefficient b.
 
         Args:
-            diff (list): list of differences between x-coordinates.
+            x_diff (np.ndarray): differences between x-coordinates.
 
         Returns:
-            np.array: the A matrix for the spline coefficient b.
+            np.ndarray: the A matrix for the spline coefficient b, in
+                diagonal ordered form (upper, main and lower diagonals).
+
+        Notes:
+            The A matrix is tridiagonal, so only its three diagonals are
+            stored, as expected by `scipy.linalg.solve_banded`.
         """
-        matrix = np.zeros((self._x_dim, self._x_dim))
-        matrix[0, 0] = 1.0
+        matrix = np.zeros((3, x_diff.shape[0] + 1))
 
-        for i in range(self._x_dim - 1):
-            if i != (self._x_dim - 2):
-                matrix[i + 1, i + 1] = 2.0 * \
-                    (self._x_diff[i] + self._x_diff[i + 1])
+        # Upper diagonal:
+        matrix[0, 2:] = x_diff[1:]
 
-            matrix[i + 1, i] = self._x_diff[i]
-            matrix[i, i + 1] = self._x_diff[i]
+        # Main diagonal:
+        matrix[1, 0] = 1.0
+        matrix[1, 1:-1] = 2.0 * (x_diff[:-1] + x_diff[1:])
+        matrix[1, -1] = 1.0
 
-        matrix[0, 1] = 0.0
-        matrix[self._x_dim - 1, self._x_dim - 2] = 0.0
-        matrix[self._x_dim - 1, self._x_dim - 1] = 1.0
+        # Lower diagonal:
+        matrix[2, :-2] = x_diff[:-1]
 
         return matrix
 
-    def __calc_matrix_b(self) -> np.array:
+    @staticmethod
+    def __calc_matrix_b(x_diff: np.ndarray, d: np.ndarray) -> np.ndarray:
         """Compute the B matrix for the spline coefficient b.
 
         Args:
-            diff (list): list of differences between x-coordinates.
+            x_diff (np.ndarray): differences between x-coordinates.
+            d (np.ndarray): values of the d coefficient.
 
         Returns:
-            np.array: the B matrix for the spline coefficient b.
+            np.ndarray: the B matrix for the spline coefficient b.
         """
-        matrix = np.zeros(self._x_dim)
-
-        for i in range(self._x_dim - 2):
-            matrix[i + 1] = (
-                3.0 * (self.d[i + 2] - self.d[i + 1]) / self._x_diff[i + 1]
-                - 3.0 * (self.d[i + 1] - self.d[i]) / self._x_diff[i]
-            )
+        matrix = np.zeros(d.shape[0])
+        matrix[1:-1] = 3.0 * (
+            (d[2:] - d[1:-1]) / x_diff[1:]
+            - (d[1:-1] - d[:-2]) / x_diff[:-1]
+        )
 
         return matrix
 
@@ -215,6 +420,21 @@ class _UnidimensionalSpline:
         """
         return bisect(self.x, x) - 1
 
+    def _indices_for(self, x: np.ndarray) -> np.ndarray:
+        """Search for the indices of the splines that contain the x-values.
+
+        Args:
+            x (np.ndarray): the x-values to search for.
+
+        Returns:
+            np.ndarray: the indices of the spline sections that contain the
+                given x-values.
+        """
+        return np.clip(
+            np.searchsorted(self.x, x, side="right") - 1,
+            0, self._x_dim - 2
+        )
+
 
 class Spline:
     """2D cubic spline class.
@@ -247,6 +467,10 @@ class Spline:
                 the interpolation process.
             gen_step (Union[int, float], optional): interpolation step. Defaults to
                 0.1.
+
+        Raises:
+            ValueError: if the number of x and y values is not the same or if
+                two consecutive coordinates are equal.
         """
         self._x = [coord.x for coord in coordinates]
         self._y = [coord.y for coord in coordinates]
@@ -255,9 +479,15 @@ class Spline:
             raise ValueError("The number of x and y values must be the same.")
 
         self._knots = self._compute_knots(self._x, self._y)
-        self._spline_x = _UnidimensionalSpline(self._knots, self._x)
-        self._spline_y = _UnidimensionalSpline(self._knots, self._y)
+
+        if not np.all(np.diff(self._knots) > 0):
+            raise ValueError("Consecutive coordinates must be different.")
+
+        self._spline_x, self._spline_y = _UnidimensionalSpline.from_shared(
+            self._knots, self._x, self._y
+        )
         self._generation_step = gen_step
+        self._samples = self._compute_samples()
         self._positions, self._curvature, self._yaw = self._compute_results()
 
     @property
@@ -279,7 +509,10 @@ class Spline:
         if not isinstance(value, (list, tuple, np.ndarray)):
             raise TypeError("x must be a list, tuple or numpy array.")
 
-        elif not all(isinstance(val, (int, float)) for val in value):
+        elif (
+            not (isinstance(value, np.ndarray) and value.dtype.kind in "biuf")
+            and not all(isinstance(val, (int, float)) for val in value)
+        ):
             raise TypeError("x must contain only numbers.")
 
         self._x = value
@@ -303,7 +536,10 @@ class Spline:
         if not isinstance(value, (list, tuple, np.ndarray)):
             raise TypeError("y must be a list, tuple or numpy array.")
 
-        elif not all(isinstance(val, (int, float)) for val in value):
+        elif (
+            not (isinstance(value, np.ndarray) and value.dtype.kind in "biuf")
+            and not all(isinstance(val, (int, float)) for val in value)
+        ):
             raise TypeError("y must contain only numbers.")
 
         self._y = value
@@ -383,47 +619,19 @@ class Spline:
             np.cumsum(np.hypot(np.diff(x), np.diff(y)))
         ))
 
-    def _compute_position(self, i: int) -> Optional[tuple]:
-        """Compute the image of a given x-value in a spline section.
-
-        Args:
-            i (int): index of the spline section.
+    def _compute_samples(self) -> np.ndarray:
+        """Compute the parameter values at which the spline is sampled.
 
         Returns:
-            Optional[tuple]: image of the x-value in the spline section. If the
-                image is outside the generation range, the output is None.
+            np.ndarray: parameter values of the samples, from the first knot
+                (included) to the last knot (excluded), separated by the
+                generation step.
         """
-        return self._spline_x.position(i), self._spline_y.position(i)
-
-    def _compute_curvature(self, i: int) -> float:
-        """Compute the curvature of a given spline section.
-
-        Args:
-            i (int): index of the spline section.
-
-        Returns:
-            float: curvature of a given spline section.
-        """
-        dx1 = self._spline_x.first_derivative(i)
-        dx2 = self._spline_x.second_derivative(i)
-        dy1 = self._spline_y.first_derivative(i)
-        dy2 = self._spline_y.second_derivative(i)
-
-        return (dy2 * dx1 - dx2 * dy1) / math.sqrt((dx1**2 + dy1**2))
-
-    def _compute_yaw(self, i: int) -> float:
-        """Compute the yaw of a given spline section.
-
-        Args:
-            i (int): index of the spline section.
+        n = int(np.ceil(
+            (self._knots[-1] - self._knots[0]) / self._generation_step
+        ))
 
-        Returns:
-            float: yaw of a given spline section.
-        """
-        return math.atan2(
-            self._spline_y.first_derivative(i),
-            self._spline_x.first_derivative(i)
-        )
+        return self._knots[0] + self._generation_step * np.arange(n)
 
     def _compute_results(self) -> tuple:
         """Compute the coordinates, curvature and yaw of the spline.
@@ -431,22 +639,18 @@ class Spline:
         Returns:
             tuple: coordinates, curvature and yaw of the spline.
         """
-        knots_ext = np.arange(
-            self._knots[0],
-            self._knots[-1],
-            self._generation_step
+        # Both splines share the same knots, hence the same indices:
+        indices = self._spline_x._indices_for(self._samples)
+
+        x, y, curvature, yaw = _evaluate_splines(
+            self._spline_x,
+            self._spline_y,
+            self._samples,
+            indices
         )
+        positions = list(map(Coordinate, x.tolist(), y.tolist()))
 
-        data = np.array(
-            [(
-                Coordinate(*self._compute_position(i)),
-                self._compute_curvature(i),
-                self._compute_yaw(i)
-            ) for i in knots_ext],
-            dtype=object
-        )
-
-        return data[:, 0], data[:, 1], data[:, 2]
+        return positions, curvature.tolist(), yaw.tolist()
 
     def plot_input(self, *args, ax=None, **kwargs) -> None:
         """Plot the input of the spline.
@@ -490,13 +694,7 @@ class Spline:
         shape = args[0] if args else self.SHAPES["line"]
 
         ax = plt.gca() if ax is None else ax
-        ax.plot(
-            np.arange(self._knots[0],
-                      self._knots[-1],
-                      self._generation_step
-                      ),
-            self._curvature, shape, **styles
-        )
+        ax.plot(self._samples, self._curvature, shape, **styles)
 
     def plot_yaw(self, *args, ax=None, **kwargs) -> None:
         """Plot the YAW function of the spline.
@@ -513,13 +711,7 @@ class Spline:
         shape = args[0] if args else self.SHAPES["line"]
 
         ax = plt.gca() if ax is None else ax
-        ax.plot(
-            np.arange(self._knots[0],
-                      self._knots[-1],
-                      self._generation_step
-                      ),
-            self._yaw, shape, **styles
-        )
+        ax.plot(self._samples, self._yaw, shape, **styles)
 
     def __str__(self) -> str:
         """Get the string epresentation of the spline.
@@ -9,15 +9,105 @@ Author:
 
 from __future__ import annotations
 
-from itertools import combinations
-from math import sqrt
-from typing import Any, Dict
+from math import hypot
+from typing import Any, Dict, Tuple
 
 from ..core import operations as op
 from ..core.coordinate import Coordinate
 from .polygon import Polygon
 
 
+def _cross(ab_x: float, ab_y: float, ac_x: float, ac_y: float) -> float:
+    """Calculate the cross product of two edges of a triangle (internal).
+
+    Args:
+        ab_x (float): x-component of the AB edge.
+        ab_y (float): y-component of the AB edge.
+        ac_x (float): x-component of the AC edge.
+        ac_y (float): y-component of the AC edge.
+
+    Returns:
+        float: cross product of the AB and AC edges (twice the signed area of
+            the triangle).
+    """
+    return ab_x * ac_y - ab_y * ac_x
+
+
+def _is_collinear(cross: float, ab_x: float, ab_y: float,
+                  ac_x: float, ac_y: float, bc_x: float, bc_y: float,
+                  tol: float) -> bool:
+    """Check whether the vertices of a triangle are collinear (internal).
+
+    Args:
+        cross (float): cross product of the AB and AC edges (see `_cross`).
+        ab_x (float): x-component of the AB edge.
+        ab_y (float): y-component of the AB edge.
+        ac_x (float): x-component of the AC edge.
+        ac_y (float): y-component of the AC edge.
+        bc_x (float): x-component of the BC edge.
+        bc_y (float): y-component of the BC edge.
+        tol (float): relative collinearity tolerance.
+
+    Returns:
+        bool: `True` if the vertices are collinear, `False` otherwise.
+
+    Note:
+        The vertices are considered collinear if the absolute value of the
+        cross product is not greater than `tol` times the square of the
+        longest edge, so that the test does not depend on the scale of the
+        triangle.
+    """
+    scale = max(
+        ab_x * ab_x + ab_y * ab_y,
+        ac_x * ac_x + ac_y * ac_y,
+        bc_x * bc_x + bc_y * bc_y
+    )
+
+    return abs(cross) <= tol * scale
+
+
+def _circumcircle(ax: float, ay: float, bx: float, by: float,
+                  cx: float, cy: float,
+                  tol: float) -> Tuple[float, float, float]:
+    """Calculate the circumcircle of three vertices (internal).
+
+    Args:
+        ax (float): x-coordinate of the first vertex.
+        ay (float): y-coordinate of the first vertex.
+        bx (float): x-coordinate of the second vertex.
+        by (float): y-coordinate of the second vertex.
+        cx (float): x-coordinate of the third vertex.
+        cy (float): y-coordinate of the third vertex.
+        tol (float): relative collinearity tolerance (see `_is_collinear`).
+
+    Raises:
+        ValueError: if the vertices are collinear.
+
+    Returns:
+        Tuple[float, float, float]: x and y-coordinates of the center and
+            radius of the circumcircle.
+    """
+    ab_x, ab_y = bx - ax, by - ay
+    ac_x, ac_y = cx - ax, cy - ay
+    bc_x, bc_y = cx - bx, cy - by
+
+    cross = _cross(ab_x, ab_y, ac_x, ac_y)
+
+    if _is_collinear(cross, ab_x, ab_y, ac_x, ac_y, bc_x, bc_y, tol):
+        raise ValueError("The triangle is collinear")
+
+    d = 2.0 * cross
+
+    a_norm = ax * ax + ay * ay
+    b_norm = bx * bx + by * by
+    c_norm = cx * cx + cy * cy
+
+    ux = (b_norm * ac_y - a_norm * bc_y - c_norm * ab_y) / d
+    uy = (a_norm * bc_x - b_norm * ac_x + c_norm * ab_x) / d
+
+    return ux, uy, hypot(ax - ux, ay - uy)
+
+
 class Circumcircle:
     """Circumcirle calculation utility.
 
@@ -32,6 +122,10 @@ class Circumcircle:
         radius (float): radius of the circumcircle.
     """
 
+    __slots__ = ("_a", "_b", "_c", "_center", "_radius", "_dirty")
+
+    COLLINEARITY_TOL = 1e-14
+
     def __init__(self, a: Coordinate, b: Coordinate, c: Coordinate) -> None:
         """Initialize a circumcircle instance.
 
@@ -40,9 +134,7 @@ class Circumcircle:
             b (Coordinate): second vertex of the triangle.
             c (Coordinate): third vertex of the triangle.
         """
-        self._a = a
-        self._b = b
-        self.c = c  # Automatically calls `Circumcircle._calculate` method.
+        self.set_vertices(a, b, c)
 
     @property
     def a(self) -> Coordinate:
@@ -53,7 +145,7 @@ class Circumcircle:
 
         Note:
             If the value of the vertex is changed, the circumcenter and
-            circumradius are recalculated.
+            circumradius are recalculated on their next access.
         """
         return self._a
 
@@ -69,13 +161,13 @@ class Circumcircle:
 
         Note:
             If the value of the vertex is changed, the circumcenter and
-            circumradius are recalculated.
+            circumradius are recalculated on their next access.
         """
         if not isinstance(value, Coordinate):
             raise TypeError("a must be a Coordinate instance")
 
         self._a = value
-        self._calculate()
+        self._dirty = True
 
     @property
     def b(self) -> Coordinate:
@@ -86,7 +178,7 @@ class Circumcircle:
 
         Note:
             If the value of the vertex is changed, the circumcenter and
-            circumradius are recalculated.
+            circumradius are recalculated on their next access.
         """
         return self._b
 
@@ -102,13 +194,13 @@ class Circumcircle:
 
         Note:
             If the value of the vertex is changed, the circumcenter and
-            circumradius are recalculated.
+            circumradius are recalculated on their next access.
         """
         if not isinstance(value, Coordinate):
             raise TypeError("b must be a Coordinate instance")
 
         self._b = value
-        self._calculate()
+        self._dirty = True
 
     @property
     def c(self) -> Coordinate:
@@ -119,7 +211,7 @@ class Circumcircle:
 
         Note:
             If the value of the vertex is changed, the circumcenter and
-            circumradius are recalculated.
+            circumradius are recalculated on their next access.
         """
         return self._c
 
@@ -135,13 +227,13 @@ class Circumcircle:
 
         Note:
             If the value of the vertex is changed, the circumcenter and
-            circumradius are recalculated.
+            circumradius are recalculated on their next access.
         """
         if not isinstance(value, Coordinate):
             raise TypeError("c must be a Coordinate instance")
 
         self._c = value
-        self._calculate()
+        self._dirty = True
 
     @property
     def center(self) -> Coordinate:
@@ -149,7 +241,14 @@ class Circumcircle:
 
         Returns:
             Coordinate: center of the circumcircle.
+
+        Raises:
+            ValueError: if the triangle is collinear.
         """
+        if self._dirty:
+            self._calculate()
+            self._dirty = False
+
         return self._center
 
     @property
@@ -158,152 +257,66 @@ class Circumcircle:
 
         Returns:
             float: radius of the circumcircle.
-        """
-        return self._radius
-
-    def _ensure_non_collinear(self) -> None:
-        """Ensure that the triangle is not collinear.
 
         Raises:
             ValueError: if the triangle is collinear.
         """
-        x_displacements = {
-            "ab": self.b.x - self.a.x,
-            "bc": self.c.x - self.b.x,
-            "ac": self.c.x - self.a.x
-        }
-
-        y_displacements = {
-            "ab": self.b.y - self.a.y,
-            "bc": self.c.y - self.b.y,
-            "ac": self.c.y - self.a.y
-        }
+        if self._dirty:
+            self._calculate()
+            self._dirty = False
 
-        if (self.a.x == self.b.x == self.c.x
-                or self.a.y == self.b.y == self.c.y):
+        return self._radius
 
-            raise ValueError("The triangle is collinear")
+    def set_vertices(self, a: Coordinate, b: Coordinate,
+                     c: Coordinate) -> None:
+        """Set all vertices of the triangle at once.
 
-        slopes = []
+        Args:
+            a (Coordinate): first vertex of the triangle.
+            b (Coordinate): second vertex of the triangle.
+            c (Coordinate): third vertex of the triangle.
 
-        if x_displacements["ab"] != 0:
-            slopes.append(y_displacements["ab"] / x_displacements["ab"])
+        Raises:
+            TypeError: if any of the values is not a Coordinate object.
 
-        if x_displacements["bc"] != 0:
-            slopes.append(y_displacements["bc"] / x_displacements["bc"])
+        Note:
+            The circumcenter and circumradius are recalculated only once, on
+            their next access after all vertices have been set.
+        """
+        if not isinstance(a, Coordinate):
+            raise TypeError("a must be a Coordinate instance")
 
-        if x_displacements["ac"] != 0:
-            slopes.append(y_displacements["ac"] / x_displacements["ac"])
+        if not isinstance(b, Coordinate):
+            raise TypeError("b must be a Coordinate instance")
 
-        if any(slope[0] == slope[1]
-               for slope in combinations(slopes, 2)):
+        if not isinstance(c, Coordinate):
+            raise TypeError("c must be a Coordinate instance")
 
-            raise ValueError("The triangle is collinear")
+        self._a = a
+        self._b = b
+        self._c = c
+        self._dirty = True
 
     def _calculate(self) -> None:
-        """Calculate the center and radius of the circumcircle."""
-        self._ensure_non_collinear()
-
-        if any(v[1] - v[0] for v in combinations(
-                (self._a, self._b, self._c), 2)):
-
-            # Vertical alignment prevention:
-
-            if not (self._b - self._a).x:
-                self._a, self._c = self._c, self._a
-
-            if not (self._c - self._a).x:
-                self._a, self._b = self._b, self._a
-
-        # Segment displacement:
-
-        displacement = {
-            "ab": Coordinate(
-                self.b.x - self.a.x,
-                self.b.y - self.a.y
-            ),
-            "ac": Coordinate(
-                self.c.x - self.a.x,
-                self.c.y - self.a.y
-            )
-        }
-
-        # Unitary vectors:
-
-        unitary = {
-            "ab": Coordinate(
-                displacement["ab"].y / sqrt(
-                    displacement["ab"].x ** 2 + displacement["ab"].y ** 2
-                ),
-                -displacement["ab"].x / sqrt(
-                    displacement["ab"].x ** 2 + displacement["ab"].y ** 2
-                )
-            ),
-            "ac": Coordinate(
-                displacement["ac"].y / sqrt(
-                    displacement["ac"].x ** 2 + displacement["ac"].y ** 2
-                ),
-                -displacement["ac"].x / sqrt(
-                    displacement["ac"].x ** 2 + displacement["ac"].y ** 2
-                )
-            )
-        }
-
-        # V-vector for vertical intersection:
-
-        vertical = {
-            "ab": Coordinate(
-                unitary["ab"].x / unitary["ab"].y,
-                1
-            ),
-            "ac": Coordinate(
-                -(unitary["ac"].x / unitary["ac"].y),
-                1
-            )
-        }
-
-        # Midpoint setting:
-
-        midpoint = {
-            "ab": Coordinate(
-                displacement["ab"].x / 2 + self.a.x,
-                displacement["ab"].y / 2 + self.a.y
-            ),
-            "ac": Coordinate(
-                displacement["ac"].x / 2 + self.a.x,
-                displacement["ac"].y / 2 + self.a.y
-            )
-        }
-
-        # Midpoint height equivalence:
-
-        intersection = Coordinate(
-            midpoint["ab"].x + (
-                (midpoint["ac"].y - midpoint["ab"].y) / unitary["ab"].y
-            ) * unitary["ab"].x,
-            midpoint["ac"].y
-        )
-
-        # Circumcenter calculation:
-
-        self._center = Coordinate(
-            intersection.x + (
-                (midpoint["ac"].x - intersection.x)
-                / (vertical["ab"].x + vertical["ac"].x)
-            ) * vertical["ab"].x,
-            intersection.y + (
-                midpoint["ac"].x - intersection.x
-            ) / (
-                vertical["ab"].x + vertical["ac"].x
-            )
-        )
+        """Calculate the center and radius of the circumcircle.
 
-        # Circumradius calculation:
+        Raises:
+            ValueError: if the triangle is collinear.
 
-        self._radius = sqrt(
-            (self.a.x - self._center.x) ** 2
-            + (self.a.y - self._center.y) ** 2
+        Note:
+            The circumcenter is obtained from the closed-form solution of the
+            intersection of the perpendicular bisectors of the triangle. The
+            triangle is considered collinear if the determinant of the
+            solution is negligible relative to the square of its longest
+            edge, up to `COLLINEARITY_TOL`.
+        """
+        ux, uy, self._radius = _circumcircle(
+            self._a.x, self._a.y,
+            self._b.x, self._b.y,
+            self._c.x, self._c.y,
+            self.COLLINEARITY_TOL
         )
+        self._center = Coordinate(ux, uy)
 
 
 class Triangle(Polygon):
@@ -523,41 +536,20 @@ class Triangle(Polygon):
 
         Returns:
             bool: `True` if the triangle is collinear, `False` otherwise.
-        """
-        x_displacements = {
-            "ab": self.b.x - self.a.x,
-            "bc": self.c.x - self.b.x,
-            "ac": self.c.x - self.a.x
-        }
-
-        y_displacements = {
-            "ab": self.b.y - self.a.y,
-            "bc": self.c.y - self.b.y,
-            "ac": self.c.y - self.a.y
-        }
-
-        if (self.a.x == self.b.x == self.c.x
-                or self.a.y == self.b.y == self.c.y):
-
-            return True
-
-        slopes = []
 
-        if x_displacements["ab"] != 0:
-            slopes.append(y_displacements["ab"] / x_displacements["ab"])
-
-        if x_displacements["bc"] != 0:
-            slopes.append(y_displacements["bc"] / x_displacements["bc"])
-
-        if x_displacements["ac"] != 0:
-            slopes.append(y_displacements["ac"] / x_displacements["ac"])
-
-        if any(slope[0] == slope[1]
-               for slope in combinations(slopes, 2)):
-
-            return True
-
-        return False
+        Note:
+            The same tolerance as the circumcircle computation is used, so a
+            triangle is collinear if and only if it has no circumcircle.
+        """
+        ab_x, ab_y = self._b.x - self._a.x, self._b.y - self._a.y
+        ac_x, ac_y = self._c.x - self._a.x, self._c.y - self._a.y
+        bc_x, bc_y = self._c.x - self._b.x, self._c.y - self._b.y
+
+        return _is_collinear(
+            _cross(ab_x, ab_y, ac_x, ac_y),
+            ab_x, ab_y, ac_x, ac_y, bc_x, bc_y,
+            Circumcircle.COLLINEARITY_TOL
+        )
 
     def __repr__(self) -> str:
         """Return the string representation of the triangle.
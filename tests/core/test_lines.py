@@ -29,6 +29,27 @@ class TestLine:
         assert Line(self.COORDS[0], self.COORDS[1]) != Line(
             self.COORDS[0], self.COORDS[2])
 
+    def test_coefficients(self):
+        line = Line(self.COORDS[2], self.COORDS[3])
+
+        assert line.slope == -1
+        assert line.intercept == -2
+
+        line.b = self.COORDS[1]
+
+        assert line.slope == 1
+        assert line.intercept == 0
+
+    def test_vertical_slope_warning(self, capsys):
+        line = Line(Coordinate(1, 0), Coordinate(1, 5))
+
+        assert capsys.readouterr().out.count("Warning") == 1
+
+        line.slope
+        line.slope
+
+        assert not capsys.readouterr().out
+
     def test_intersection(self):
         line_1 = Line(self.COORDS[0], self.COORDS[1])
         line_2 = Line(self.COORDS[2], self.COORDS[3])
@@ -69,3 +90,12 @@ class TestSegment:
 
         assert segment_1 * \
             segment_2 == segment_1.intersect(segment_2) == self.COORDS[0]
+
+    def test_distance(self):
+        segment = Segment(self.COORDS[0], Coordinate(3, 4))
+
+        assert segment.distance == 5
+
+        segment.a = Coordinate(3, 0)
+
+        assert segment.distance == 4
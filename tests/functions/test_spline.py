@@ -1,8 +1,8 @@
 import json
 from typing import Sequence
 
-import matplotlib.pyplot as plt
 import numpy as np
+import pytest
 
 from bidimensional import Coordinate
 from bidimensional.functions import Spline
@@ -50,7 +50,7 @@ class TestSpline:
 
         assert tested == valid
 
-    def no_test_curvature(self):
+    def test_curvature(self):
         tested = [
             round(value, self.DIGITS)
             for value in self.SPLINE.curvature
@@ -60,17 +60,56 @@ class TestSpline:
             for value in self.DATA_1["curvature"]
         ]
 
-        base = np.arange(
+        assert tested == valid
+
+    def test_vectorized_evaluation(self):
+        samples = np.arange(
             self.SPLINE._knots[0],
             self.SPLINE._knots[-1],
             self.SPLINE._generation_step
         )
 
-        plt.plot(base, tested, "r-", label="Tested")
-        plt.plot(base, valid, "g-", label="Valid")
-        plt.grid()
-        plt.show()
-        return
+        for spline in (self.SPLINE._spline_x, self.SPLINE._spline_y):
+            for scalar, vector in (
+                (spline.position, spline.position_vec),
+                (spline.first_derivative, spline.first_derivative_vec),
+                (spline.second_derivative, spline.second_derivative_vec)
+            ):
+                tested = [
+                    round(value, self.DIGITS)
+                    for value in vector(samples)
+                ]
+                valid = [
+                    round(scalar(value), self.DIGITS)
+                    for value in samples
+                ]
+
+                assert tested == valid
+
+    def test_coordinate_setters(self):
+        spline = Spline(self.COORDINATES)
+
+        spline.x = np.arange(5)
+        spline.y = np.linspace(0.0, 1.0, 5)
+        spline.x = [0, 1.0, 2]
+
+        with pytest.raises(TypeError):
+            spline.x = np.array(["a", "b"])
+
+        with pytest.raises(TypeError):
+            spline.y = [0, "b"]
+
+    def test_coefficients_read_only(self):
+        spline = self.SPLINE._spline_x
+
+        with pytest.raises(ValueError):
+            spline.coefs[:] = 0
+
+        with pytest.raises(ValueError):
+            spline.a[0] = 0
+
+    def test_repeated_coordinates(self):
+        coordinates = self.COORDINATES[:3] + self.COORDINATES[2:]
 
-        diff = [abs(t - v) for t, v in zip(tested, valid)]
-        assert all(d < 1 for d in diff)
+        with pytest.raises(ValueError):
+            Spline(coordinates)
@@ -11,8 +11,11 @@ Author:
 from itertools import combinations, permutations
 from math import sqrt
 
+import pytest
+
 from bidimensional import Coordinate
 from bidimensional.polygons import Triangle
+from bidimensional.polygons.triangle import Circumcircle
 
 
 class TestTriangle:
@@ -137,6 +140,29 @@ class TestTriangle:
                 triangle = Triangle(*triplet)
                 assert triangle.is_collinear()
 
+    def test_collinear_tolerance(self) -> None:
+        """Vertex collinearity tolerance test.
+
+        This test case checks if the `is_collinear` method agrees with the
+        circumcircle computation on vertices affected by floating point noise,
+        regardless of their order.
+        """
+
+        # Vertices on y = 0.7x + 0.3 with floating point noise:
+
+        coordinates = (
+            Coordinate(1.1e6, 770000.3),
+            Coordinate(1.3e6, 910000.3),
+            Coordinate(2.7e6, 1890000.2999999998)
+        )
+
+        for triplet in permutations(coordinates, 3):
+            triangle = Triangle(*triplet)
+            assert triangle.is_collinear()
+
+            with pytest.raises(ValueError):
+                triangle.circumcenter
+
     def test_non_collinear(self) -> None:
         """Vertex non-collinearity test.
 
@@ -410,3 +436,105 @@ class TestTriangle:
 
         assert triangle.circumcenter == Coordinate(.5, .5)
         assert triangle.circumradius == sqrt(.5)
+
+    def test_circumcircle_vertex_order(self) -> None:
+        """Triangle circumcircle vertex order test.
+
+        This test case checks if the `circumcenter` and `circumradius`
+        attributes are independent of the definition order of the vertices,
+        including definitions with vertically aligned edges.
+        """
+
+        coordinates = (
+            Coordinate(0, 0),
+            Coordinate(0, 2),
+            Coordinate(2, 0)
+        )
+
+        for triplet in permutations(coordinates, 3):
+            triangle = Triangle(*triplet)
+
+            assert triangle.circumcenter == Coordinate(1, 1)
+            assert triangle.circumradius == sqrt(2)
+
+    def test_circumcircle_collinear(self) -> None:
+        """Triangle circumcircle collinearity test.
+
+        This test case checks if the circumcircle computation raises an error
+        when the vertices of the triangle are collinear.
+        """
+
+        triangle = Triangle(
+            Coordinate(0, 0),
+            Coordinate(1, 1),
+            Coordinate(2, 2)
+        )
+
+        with pytest.raises(ValueError):
+            triangle.circumcenter
+
+        triangle = Triangle(
+            Coordinate(0.1, 0.1),
+            Coordinate(0.2, 0.2),
+            Coordinate(0.3, 0.3)
+        )
+
+        with pytest.raises(ValueError):
+            triangle.circumcenter
+
+    def test_circumcircle_scale(self) -> None:
+        """Triangle circumcircle scale test.
+
+        This test case checks if the circumcircle of very small and very large
+        (but valid) triangles is computed instead of being rejected as
+        collinear.
+        """
+
+        for scale in (1e-8, 1e6):
+            triangle = Triangle(
+                Coordinate(0, 0),
+                Coordinate(scale, 0),
+                Coordinate(0, scale)
+            )
+
+            assert triangle.circumcenter.x == pytest.approx(scale / 2)
+            assert triangle.circumcenter.y == pytest.approx(scale / 2)
+            assert triangle.circumradius == pytest.approx(scale * sqrt(.5))
+
+    def test_circumcircle_set_vertices(self) -> None:
+        """Circumcircle vertex update test.
+
+        This test case checks if updating the vertices of a circumcircle,
+        either one by one or all at once, recalculates its center and radius.
+        """
+
+        circumcircle = Circumcircle(
+            Coordinate(0, 0),
+            Coordinate(1, 0),
+            Coordinate(0, 1)
+        )
+
+        circumcircle.set_vertices(
+            Coordinate(0, 0),
+            Coordinate(2, 0),
+            Coordinate(0, 2)
+        )
+
+        assert circumcircle.center == Coordinate(1, 1)
+        assert circumcircle.radius == sqrt(2)
+
+        circumcircle.a = Coordinate(2, 2)
+
+        assert circumcircle.center == Coordinate(1, 1)
+        assert circumcircle.radius == sqrt(2)
+
+        with pytest.raises(TypeError):
+            circumcircle.set_vertices(Coordinate(0, 0), Coordinate(2, 0), 0)
+
+        # Intermediate collinear states are not calculated:
+
+        circumcircle.b = Coordinate(1, 1)
+        circumcircle.b = Coordinate(2, 0)
+        circumcircle.c = Coordinate(0, 2)
+
+        assert circumcircle.center == Coordinate(1, 1)